@@ -1,131 +1,354 @@
 import os
 import re
-import validators
+import json
+import hashlib
+import functools
+from collections import OrderedDict, namedtuple
+from enum import IntEnum
+from operator import itemgetter
 import streamlit as st
 from dotenv import load_dotenv
-from langchain.prompts import PromptTemplate
-from langchain_groq import ChatGroq
-from langchain.chains.summarize import load_summarize_chain
-from langchain_community.document_loaders import YoutubeLoader, UnstructuredURLLoader, PyPDFLoader
-from langchain.schema import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-import requests
-import tempfile
+from langchain_core.documents import Document
+from langchain_core.callbacks import BaseCallbackHandler
 import io
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
 
 # Load environment variables
 load_dotenv()
 
+class CType(IntEnum):
+    """Content types offered by the type selector"""
+    YT = 0
+    WEB = 1
+    PDF = 2
+
+CONTENT_LABELS = ("🎥 YouTube Video", "🌐 Website/Article", "📄 PDF Document")
+
+# Seconds to wait for the concurrent YouTube loaders
+YOUTUBE_TIMEOUT = 15
+
+# Roughly the characters that fit in the model context alongside the prompt
+MAX_STUFF_CHARS = 24000
+SPLIT_SEPARATORS = ["\n\n", "\n", ". ", " "]
+
+# Stylesheet injected on every rerun
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+
+# URL checks, summaries and parsed PDFs kept per session, oldest evicted first
+URL_CACHE_SIZE = 64
+SUMMARY_CACHE_SIZE = 32
+PDF_CACHE_SIZE = 8
+
+# Summary prompt shared by the stuff and map_reduce chains
+PROMPT_TEMPLATE = """
+Provide a comprehensive and well-structured summary of the following content in approximately 300 words:
+
+Content: {text}
+
+Focus on:
+- Main points and key insights
+- Important details and context
+- Clear, organized structure
+- Actionable information if applicable
+"""
+
+# Matches watch, youtu.be, embed and /v/ YouTube URL formats in a single pass
+_YT_VIDEO_ID = re.compile(r'(?:youtube\.com\/(?:watch\?v=|embed\/|v\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})')
+
+# Website URL validation and YouTube hosts, used on every rerun
+_URL_VALID = re.compile(r'^https?:\/\/[^\s\/$.?#].[^\s]*$', re.IGNORECASE)
+_YT_HOSTS = ('youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com')
+
+# Pulls the text out of each transcript segment
+_get_text = itemgetter('text')
+
+# Title and description fields embedded in the watch page JSON
+_YT_META = re.compile(r'"(title|shortDescription)":"((?:[^"\\]|\\.)*)"')
+YT_META_TAIL = 16384
+
+def _unescape_json(value):
+    """Decode a JSON string body captured from the watch page"""
+    try:
+        return json.loads(f'"{value}"')
+    except ValueError:
+        return value
+
+UrlCheck = namedtuple('UrlCheck', ['is_valid', 'is_youtube'])
+
+def check_url(url):
+    """Return a UrlCheck for a URL, cached per session"""
+    cache = st.session_state.setdefault('url_checks', OrderedDict())
+    if url in cache:
+        cache.move_to_end(url)
+    else:
+        # Allow scheme-less YouTube links like "youtu.be/..." to parse a host
+        try:
+            host = (urlsplit(url if "://" in url else f"//{url}").hostname or "").lower()
+        except ValueError:
+            host = ""
+        is_youtube = host in _YT_HOSTS or host.endswith('.youtube.com')
+        cache[url] = UrlCheck(bool(_URL_VALID.match(url)), is_youtube)
+        if len(cache) > URL_CACHE_SIZE:
+            cache.popitem(last=False)
+    return cache[url]
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Shared HTTP session so connections are reused across reruns"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=1, backoff_factor=0.2))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+@functools.lru_cache(maxsize=256)
 def extract_video_id(url):
     """Extract YouTube video ID from various URL formats"""
-    patterns = [
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/watch\?v=([a-zA-Z0-9_-]+)',
-        r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([a-zA-Z0-9_-]+)',
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/embed\/([a-zA-Z0-9_-]+)',
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/v\/([a-zA-Z0-9_-]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _YT_VIDEO_ID.search(url)
+    return match.group(1) if match else None
 
-def load_youtube_content(url):
-    """Load YouTube content with fallback methods"""
-    video_id = extract_video_id(url)
-    if not video_id:
-        raise ValueError("Could not extract video ID from URL")
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _load_youtube_transcript(url, video_id):
+    """Race the transcript methods; cached, raises when no transcript is found"""
+    from langchain_community.document_loaders import YoutubeLoader
+    from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+    
+    def transcript_api():
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        try:
+            transcript = transcript_list.find_transcript(['en'])
+        except NoTranscriptFound:
+            transcript = transcript_list.find_generated_transcript(['en'])
+        
+        transcript_data = transcript.fetch()
+        full_text = " ".join(map(_get_text, transcript_data))
+        return [Document(page_content=full_text, metadata={"source": url})]
     
-    # Try multiple methods silently
+    # Race all transcript methods silently, first non-empty result wins
     methods = [
         lambda: YoutubeLoader.from_youtube_url(url, add_video_info=True).load(),
         lambda: YoutubeLoader.from_youtube_url(f"https://www.youtube.com/watch?v={video_id}", add_video_info=False).load(),
-        lambda: YoutubeLoader.from_youtube_url(url, add_video_info=True, language=["en", "auto"]).load()
+        lambda: YoutubeLoader.from_youtube_url(url, add_video_info=True, language=["en", "auto"]).load(),
+        transcript_api
     ]
     
-    for method in methods:
+    executor = ThreadPoolExecutor(max_workers=len(methods))
+    try:
+        futures = [executor.submit(method) for method in methods]
+        
         try:
-            docs = method()
-            if docs and docs[0].page_content.strip():
-                return docs, "transcript"
-        except:
-            continue
+            for future in as_completed(futures, timeout=YOUTUBE_TIMEOUT):
+                try:
+                    docs = future.result()
+                    if docs and docs[0].page_content.strip():
+                        return docs
+                except VideoUnavailable:
+                    # Nothing else can be fetched for this video
+                    raise
+                except (TranscriptsDisabled, NoTranscriptFound):
+                    # The other methods use the same transcripts, stop waiting on them
+                    break
+                except Exception:
+                    continue
+        except TimeoutError:
+            pass
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    raise Exception("No transcript available for YouTube video")
+
+def _load_youtube_info(url, video_id):
+    """Title and description scraped from the watch page, or None"""
+    response = get_http_session().get(f"https://www.youtube.com/watch?v={video_id}", timeout=(3, 10), stream=True)
+    
+    if response.status_code != 200:
+        response.close()
+        return None
+    
+    # Scan the page as it streams in and stop reading once both fields are found
+    response.encoding = response.encoding or "utf-8"
+    meta = {}
+    buffer = ""
+    with response:
+        for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+            buffer += chunk
+            for match in _YT_META.finditer(buffer):
+                meta.setdefault(match.group(1), _unescape_json(match.group(2)))
+            if len(meta) == 2:
+                break
+            # Keep a tail so a field split across chunks is still matched
+            buffer = buffer[-YT_META_TAIL:]
+    
+    title = meta.get("title") or f"YouTube Video {video_id}"
+    description = meta.get("shortDescription") or "No description available."
+    
+    content = f"Title: {title}\n\nDescription: {description}"
+    return [Document(page_content=content, metadata={"source": url, "title": title})]
+
+def load_youtube_content(url):
+    """Load YouTube content with fallback methods"""
+    import requests
+    from youtube_transcript_api import VideoUnavailable
+    
+    video_id = extract_video_id(url)
+    if not video_id:
+        raise ValueError("Could not extract video ID from URL")
     
-    # Try youtube-transcript-api
     try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        try:
-            transcript = transcript_list.find_transcript(['en'])
-        except:
-            transcript = transcript_list.find_generated_transcript(['en'])
-        
-        transcript_data = transcript.fetch()
-        full_text = " ".join([item['text'] for item in transcript_data])
-        doc = Document(page_content=full_text, metadata={"source": url})
-        return [doc], "transcript"
-    except:
+        return _load_youtube_transcript(url, video_id), "transcript"
+    except VideoUnavailable:
+        raise Exception("Unable to extract content from YouTube video")
+    except Exception:
         pass
     
-    # Fallback to video info
+    # Fallback to video info, left uncached so a later retry attempts the transcript again
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(f"https://www.youtube.com/watch?v={video_id}", headers=headers)
-        
-        if response.status_code == 200:
-            title_match = re.search(r'"title":"([^"]+)"', response.text)
-            title = title_match.group(1) if title_match else f"YouTube Video {video_id}"
-            
-            desc_match = re.search(r'"shortDescription":"([^"]+)"', response.text)
-            description = desc_match.group(1) if desc_match else "No description available."
-            
-            content = f"Title: {title}\n\nDescription: {description}"
-            doc = Document(page_content=content, metadata={"source": url, "title": title})
-            return [doc], "basic_info"
-    except:
+        docs = _load_youtube_info(url, video_id)
+        if docs:
+            return docs, "basic_info"
+    except requests.RequestException:
         pass
     
     raise Exception("Unable to extract content from YouTube video")
 
-def load_pdf_content(uploaded_file):
-    """Load PDF content from uploaded file"""
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def load_website_content(url):
+    """Load website content"""
+    from langchain_community.document_loaders import UnstructuredURLLoader
+    
+    loader = UnstructuredURLLoader(
+        urls=[url],
+        ssl_verify=False,
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    )
+    docs = loader.load()
+    if not docs:
+        raise Exception("No content extracted")
+    return docs
+
+@functools.lru_cache(maxsize=None)
+def _lazy_get_pypdf():
+    """Import pypdf on first PDF upload only"""
+    from pypdf import PdfReader
+    return PdfReader
+
+def _parse_pdf(pdf_bytes, file_name):
+    """Parse PDF bytes into a single document"""
     try:
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
-        
-        # Load PDF using PyPDFLoader
-        loader = PyPDFLoader(tmp_file_path)
-        documents = loader.load()
+        # Parse PDF straight from memory
+        reader = _lazy_get_pypdf()(io.BytesIO(pdf_bytes))
+        texts = [page.extract_text() or "" for page in reader.pages]
+        page_count = len(texts)
         
-        # Clean up temporary file
-        os.unlink(tmp_file_path)
-        
-        if not documents:
+        if not texts:
             raise Exception("No content extracted from PDF")
         
-        # Split large documents if needed
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=4000,
-            chunk_overlap=200,
-            length_function=len,
-        )
-        
-        # Combine all pages into one document for summarization
-        full_text = "\n\n".join([doc.page_content for doc in documents])
+        # One document for the whole file, the stuff chain would join the pages anyway
+        full_text = "\n\n".join(texts)
+        return [Document(page_content=full_text, metadata={"source": file_name, "pages": page_count})]
         
-        # Split if too large
-        if len(full_text) > 10000:
-            split_docs = text_splitter.split_documents(documents)
-            return split_docs
-        else:
-            return documents
-            
     except Exception as e:
         raise Exception(f"Error processing PDF: {str(e)}")
 
+def select_chain(docs):
+    """Pick the summarize chain type, splitting docs only when they overflow the model context"""
+    if sum(len(doc.page_content) for doc in docs) <= MAX_STUFF_CHARS:
+        return "stuff", docs
+    
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=4000,
+        chunk_overlap=200,
+        length_function=len,
+        separators=SPLIT_SEPARATORS,
+    )
+    return "map_reduce", text_splitter.split_documents(docs)
+
+class StreamHandler(BaseCallbackHandler):
+    """Render LLM tokens into a Streamlit placeholder as they arrive"""
+    
+    def __init__(self, placeholder):
+        self.placeholder = placeholder
+        self.text = ""
+    
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        # map_reduce issues several calls, only keep the latest one on screen
+        self.text = ""
+    
+    def on_llm_new_token(self, token, **kwargs):
+        self.text += token
+        self.placeholder.markdown(self.text)
+
+def content_hash(docs):
+    """SHA-256 of the documents' text, used to key cached summaries"""
+    hasher = hashlib.sha256()
+    for doc in docs:
+        hasher.update(doc.page_content.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_llm(api_key):
+    """Groq chat model, reused across reruns"""
+    from langchain_groq import ChatGroq
+    
+    return ChatGroq(model="gemma2-9b-it", api_key=api_key, streaming=True)
+
+@st.cache_resource(show_spinner=False)
+def get_prompt():
+    """Summary prompt template, reused across reruns"""
+    from langchain.prompts import PromptTemplate
+    
+    return PromptTemplate(template=PROMPT_TEMPLATE, input_variables=["text"])
+
+@st.cache_resource(show_spinner=False)
+def get_chain(api_key, chain_type):
+    """Summarize chain for the given chain type, reused across reruns"""
+    from langchain.chains.summarize import load_summarize_chain
+    
+    llm, prompt = get_llm(api_key), get_prompt()
+    if chain_type == "stuff":
+        return load_summarize_chain(llm, chain_type="stuff", prompt=prompt)
+    return load_summarize_chain(llm, chain_type="map_reduce", map_prompt=prompt, combine_prompt=prompt)
+
+def pdf_digest(uploaded_file):
+    """SHA-256 of an uploaded PDF, computed once per upload"""
+    digests = st.session_state.setdefault('pdf_digests', OrderedDict())
+    if uploaded_file.file_id in digests:
+        digests.move_to_end(uploaded_file.file_id)
+    else:
+        digests[uploaded_file.file_id] = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+        if len(digests) > PDF_CACHE_SIZE:
+            digests.popitem(last=False)
+    return digests[uploaded_file.file_id]
+
+def load_pdf_content(uploaded_file, pdf_hash):
+    """Load PDF content from uploaded file, cached per session on the SHA-256 of its bytes"""
+    pdf_cache = st.session_state.setdefault('pdf_cache', OrderedDict())
+    if pdf_hash in pdf_cache:
+        pdf_cache.move_to_end(pdf_hash)
+    else:
+        pdf_cache[pdf_hash] = _parse_pdf(uploaded_file.getvalue(), uploaded_file.name)
+        if len(pdf_cache) > PDF_CACHE_SIZE:
+            pdf_cache.popitem(last=False)
+    return pdf_cache[pdf_hash]
+
+@st.cache_resource(show_spinner=False)
+def load_css():
+    """Read the app stylesheet once per server process"""
+    with open(CSS_PATH, encoding="utf-8") as css_file:
+        return css_file.read()
+
 # Streamlit page configuration
 st.set_page_config(
     page_title="AI Content Summarizer",
@@ -134,375 +357,7 @@ st.set_page_config(
 )
 
 # Custom CSS - Enhanced for new features
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    .stApp {
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
-        font-family: 'Inter', sans-serif;
-        color: #f8fafc;
-    }
-    
-    /* Remove Streamlit default styling */
-    .stApp > header {
-        background: transparent;
-    }
-    
-    /* Compact Header - Elegant & Professional */
-    .main-header {
-        text-align: center;
-        padding: 2rem 1.5rem;
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.95) 0%, rgba(30, 41, 59, 0.95) 100%);
-        border-radius: 16px;
-        margin: 1rem 0 2rem 0;
-        backdrop-filter: blur(30px);
-        border: 1px solid rgba(148, 163, 184, 0.15);
-        box-shadow: 
-            0 10px 25px rgba(0, 0, 0, 0.3),
-            0 0 0 1px rgba(255, 255, 255, 0.05) inset;
-        position: relative;
-    }
-    
-    /* Larger, Bold Title */
-    .main-header h1 {
-        background: linear-gradient(135deg, #ffffff 0%, #e2e8f0 50%, #cbd5e1 100%);
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-        background-clip: text !important;
-        font-size: 2.8rem !important;
-        font-weight: 700 !important;
-        margin-bottom: 0.5rem !important;
-        letter-spacing: -0.02em !important;
-        line-height: 1.2 !important;
-    }
-    
-    .main-header p {
-        color: #e2e8f0 !important;
-        font-size: 1.1rem !important;
-        font-weight: 500 !important;
-        margin: 0 !important;
-        opacity: 0.95;
-        max-width: 550px;
-        margin: 0 auto !important;
-        line-height: 1.5;
-    }
-    
-    /* Compact Content Type Section */
-    .content-type-section {
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.8) 0%, rgba(30, 41, 59, 0.8) 100%);
-        padding: 1.8rem;
-        border-radius: 16px;
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(148, 163, 184, 0.12);
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.25);
-        margin-bottom: 2rem;
-    }
-    
-    .content-type-section h3 {
-        color: #f1f5f9 !important;
-        font-size: 1.3rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 1.5rem !important;
-        text-align: center;
-        letter-spacing: -0.01em;
-    }
-    
-    /* Radio button styling - Enhanced */
-    .stRadio > div {
-        display: flex !important;
-        flex-direction: row !important;
-        gap: 1rem !important;
-        justify-content: center !important;
-        flex-wrap: wrap !important;
-    }
-    
-    .stRadio > div > label {
-        background: linear-gradient(135deg, rgba(30, 41, 59, 0.9) 0%, rgba(51, 65, 85, 0.8) 100%) !important;
-        border: 1px solid rgba(148, 163, 184, 0.25) !important;
-        border-radius: 16px !important;
-        padding: 1.2rem 2rem !important;
-        cursor: pointer !important;
-        transition: all 0.3s ease !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        min-width: 180px !important;
-        font-weight: 500 !important;
-        color: #e2e8f0 !important;
-        position: relative !important;
-        overflow: hidden !important;
-        backdrop-filter: blur(10px) !important;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15) !important;
-    }
-    
-    .stRadio > div > label::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(59, 130, 246, 0.1), transparent);
-        transition: left 0.5s ease;
-    }
-    
-    .stRadio > div > label:hover {
-        border: 1px solid #3b82f6 !important;
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.15) 0%, rgba(30, 41, 59, 0.9) 100%) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 20px rgba(59, 130, 246, 0.2) !important;
-        color: #f1f5f9 !important;
-    }
-    
-    .stRadio > div > label:hover::before {
-        left: 100%;
-    }
-    
-    .stRadio > div > label > div:first-child {
-        display: none !important;
-    }
-    
-    /* Selected state styling */
-    .stRadio > div > label[data-selected="true"] {
-        background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%) !important;
-        border: 1px solid #3b82f6 !important;
-        color: white !important;
-        box-shadow: 0 6px 16px rgba(59, 130, 246, 0.3) !important;
-    }
-    
-    /* Input Section */
-    .input-section {
-        background: rgba(15, 23, 42, 0.6);
-        padding: 2rem;
-        border-radius: 16px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(148, 163, 184, 0.1);
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2);
-        margin-bottom: 2rem;
-    }
-    
-    .input-section h3 {
-        color: #e2e8f0 !important;
-        font-size: 1.25rem !important;
-        font-weight: 500 !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    /* Input Field Styling */
-    .stTextInput > div > div > input {
-        background: rgba(30, 41, 59, 0.8) !important;
-        border: 1px solid rgba(148, 163, 184, 0.2) !important;
-        border-radius: 12px !important;
-        color: #f8fafc !important;
-        font-size: 16px !important;
-        padding: 14px 18px !important;
-        transition: all 0.2s ease !important;
-        font-weight: 400 !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border: 1px solid #3b82f6 !important;
-        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1) !important;
-        outline: none !important;
-    }
-    
-    .stTextInput > div > div > input::placeholder {
-        color: #64748b !important;
-    }
-    
-    /* File uploader styling */
-    .stFileUploader > div > div {
-        background: rgba(30, 41, 59, 0.8) !important;
-        border: 2px dashed rgba(148, 163, 184, 0.3) !important;
-        border-radius: 12px !important;
-        padding: 2rem !important;
-        text-align: center !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .stFileUploader > div > div:hover {
-        border-color: #3b82f6 !important;
-        background: rgba(59, 130, 246, 0.05) !important;
-    }
-    
-    /* Button Styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 14px 32px !important;
-        font-size: 16px !important;
-        font-weight: 500 !important;
-        width: 100% !important;
-        margin-top: 1rem !important;
-        transition: all 0.2s ease !important;
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.25) !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 6px 16px rgba(59, 130, 246, 0.35) !important;
-        background: linear-gradient(135deg, #1d4ed8 0%, #1e40af 100%) !important;
-    }
-    
-    /* Success/Error Messages */
-    .stSuccess {
-        background: rgba(34, 197, 94, 0.1) !important;
-        border: 1px solid rgba(34, 197, 94, 0.2) !important;
-        border-radius: 12px !important;
-        color: #22c55e !important;
-    }
-    
-    .stError {
-        background: rgba(239, 68, 68, 0.1) !important;
-        border: 1px solid rgba(239, 68, 68, 0.2) !important;
-        border-radius: 12px !important;
-        color: #ef4444 !important;
-    }
-    
-    .stInfo {
-        background: rgba(59, 130, 246, 0.1) !important;
-        border: 1px solid rgba(59, 130, 246, 0.2) !important;
-        border-radius: 12px !important;
-        color: #3b82f6 !important;
-    }
-    
-    /* Summary Container */
-    .summary-container {
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.9) 0%, rgba(30, 41, 59, 0.9) 100%);
-        padding: 2.5rem;
-        border-radius: 16px;
-        border: 1px solid rgba(148, 163, 184, 0.15);
-        margin: 2rem 0;
-        color: #f8fafc !important;
-        line-height: 1.7;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        backdrop-filter: blur(20px);
-        transition: all 0.3s ease;
-    }
-    
-    .summary-container:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.4);
-        border: 1px solid rgba(148, 163, 184, 0.25);
-    }
-    
-    .summary-title {
-        font-size: 1.5rem;
-        font-weight: 600;
-        margin-bottom: 1.5rem;
-        text-align: center;
-        color: #e2e8f0 !important;
-        letter-spacing: -0.01em;
-    }
-    
-    .summary-container p {
-        color: #cbd5e1 !important;
-        margin-bottom: 1rem;
-    }
-    
-    .summary-container * {
-        color: #cbd5e1 !important;
-    }
-    
-    /* Enhanced Metrics Styling - Centered */
-    .metric-container {
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.9) 0%, rgba(30, 41, 59, 0.9) 100%);
-        border-radius: 16px;
-        padding: 2rem 1.5rem;
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(148, 163, 184, 0.15);
-        transition: all 0.3s ease;
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.2);
-        text-align: center !important;
-        position: relative;
-        overflow: hidden;
-        min-height: 120px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-    }
-    
-    .metric-container::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 2px;
-        background: linear-gradient(90deg, transparent, rgba(59, 130, 246, 0.4), transparent);
-    }
-    
-    .metric-container:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 30px rgba(59, 130, 246, 0.15);
-        border: 1px solid rgba(59, 130, 246, 0.3);
-    }
-    
-    /* Center align all metric content */
-    .metric-container * {
-        text-align: center !important;
-        justify-content: center !important;
-        align-items: center !important;
-    }
-    
-    .metric-container [data-testid="metric-container"] {
-        text-align: center !important;
-        justify-content: center !important;
-        align-items: center !important;
-        width: 100% !important;
-    }
-    
-    .metric-container [data-testid="metric-container"] > div {
-        text-align: center !important;
-        justify-content: center !important;
-        align-items: center !important;
-        margin: 0 auto !important;
-    }
-    
-    /* Fix metric label and value alignment */
-    .metric-container [data-testid="metric-container"] [data-testid="metric-container-label"] {
-        text-align: center !important;
-        color: #cbd5e1 !important;
-        font-weight: 600 !important;
-        font-size: 0.9rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    .metric-container [data-testid="metric-container"] [data-testid="metric-container-value"] {
-        text-align: center !important;
-        color: #f1f5f9 !important;
-        font-weight: 700 !important;
-        font-size: 1.8rem !important;
-    }
-    
-    /* Footer */
-    .footer {
-        background: rgba(15, 23, 42, 0.6);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-top: 3rem;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(148, 163, 184, 0.1);
-        text-align: center;
-    }
-    
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Fix text colors */
-    .stMarkdown, .stMarkdown p, .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
-        color: #f8fafc !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Header
 st.markdown('''
@@ -521,13 +376,14 @@ st.markdown('''
 
 content_type = st.radio(
     "Select the type of content you want to summarize:",
-    ["🎥 YouTube Video", "🌐 Website/Article", "📄 PDF Document"],
+    list(CType),
+    format_func=lambda ctype: CONTENT_LABELS[ctype],
     horizontal=True,
     label_visibility="collapsed"
 )
 
 # Dynamic input section based on selection
-if content_type == "🎥 YouTube Video":
+if content_type is CType.YT:
     st.markdown('''
     <div class="input-section">
         <h3>🎬 Enter YouTube Video URL</h3>
@@ -544,13 +400,13 @@ if content_type == "🎥 YouTube Video":
     # URL validation for YouTube
     url_valid = False
     if generic_url:
-        if "youtube.com" in generic_url or "youtu.be" in generic_url:
+        if check_url(generic_url).is_youtube:
             st.success("🎥 YouTube video detected")
             url_valid = True
         else:
             st.error("❌ Please enter a valid YouTube URL")
 
-elif content_type == "🌐 Website/Article":
+elif content_type is CType.WEB:
     st.markdown('''
     <div class="input-section">
         <h3>🔗 Enter Website URL</h3>
@@ -567,7 +423,7 @@ elif content_type == "🌐 Website/Article":
     # URL validation for websites
     url_valid = False
     if generic_url:
-        if validators.url(generic_url):
+        if check_url(generic_url).is_valid:
             st.success("🌐 Website URL detected")
             url_valid = True
         else:
@@ -590,6 +446,7 @@ else:  # PDF Document
     url_valid = uploaded_file is not None
     if uploaded_file:
         st.success(f"📄 PDF uploaded: {uploaded_file.name}")
+        pdf_hash = pdf_digest(uploaded_file)
         generic_url = None  # Not needed for PDF
 
 # Summarize button
@@ -598,29 +455,29 @@ generate_summary = st.button("🚀 Generate Summary")
 # Auto-generate summary when user enters a valid URL or uploads a file
 should_generate = False
 
-if content_type in ["🎥 YouTube Video", "🌐 Website/Article"]:
+if content_type is not CType.PDF:
     # Check if URL changed and is valid
     if generic_url and url_valid:
-        current_input_key = f"{content_type}_{generic_url}"
+        current_input_key = f"{content_type.name}_{generic_url}"
         if st.session_state.get('last_processed_input') != current_input_key:
             should_generate = True
             st.session_state.last_processed_input = current_input_key
 
-elif content_type == "📄 PDF Document":
+elif content_type is CType.PDF:
     # Check if file is uploaded
     if uploaded_file:
-        current_input_key = f"{content_type}_{uploaded_file.name}_{uploaded_file.size}"
+        current_input_key = f"{content_type.name}_{pdf_hash}"
         if st.session_state.get('last_processed_input') != current_input_key:
             should_generate = True
             st.session_state.last_processed_input = current_input_key
 
 # Generate summary automatically or when button is clicked
 if generate_summary or should_generate:
-    if content_type in ["🎥 YouTube Video", "🌐 Website/Article"] and not generic_url.strip():
+    if content_type is not CType.PDF and not generic_url.strip():
         st.error("📝 Please enter a URL to get started!")
-    elif content_type == "📄 PDF Document" and not uploaded_file:
+    elif content_type is CType.PDF and not uploaded_file:
         st.error("📝 Please upload a PDF file to get started!")
-    elif content_type in ["🎥 YouTube Video", "🌐 Website/Article"] and not url_valid:
+    elif content_type is not CType.PDF and not url_valid:
         st.error("🔗 Please enter a valid URL")
     else:
         # Check API key
@@ -630,26 +487,9 @@ if generate_summary or should_generate:
         else:
             try:
                 # Show loading
-                with st.spinner(f"Processing {content_type.lower()}..."):
-                    # Initialize model
-                    llm = ChatGroq(model="gemma2-9b-it", api_key=groq_api_key)
-                    
-                    # Prompt template
-                    prompt_template = """
-                    Provide a comprehensive and well-structured summary of the following content in approximately 300 words:
-                    
-                    Content: {text}
-                    
-                    Focus on:
-                    - Main points and key insights
-                    - Important details and context
-                    - Clear, organized structure
-                    - Actionable information if applicable
-                    """
-                    prompt = PromptTemplate(template=prompt_template, input_variables=["text"])
-                    
+                with st.spinner(f"Processing {CONTENT_LABELS[content_type].lower()}..."):
                     # Load content based on type
-                    if content_type == "🎥 YouTube Video":
+                    if content_type is CType.YT:
                         try:
                             docs, content_type_info = load_youtube_content(generic_url)
                         except Exception:
@@ -657,16 +497,9 @@ if generate_summary or should_generate:
                             st.info("💡 Try a different video or check if it has captions available")
                             st.stop()
                     
-                    elif content_type == "🌐 Website/Article":
+                    elif content_type is CType.WEB:
                         try:
-                            loader = UnstructuredURLLoader(
-                                urls=[generic_url],
-                                ssl_verify=False,
-                                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-                            )
-                            docs = loader.load()
-                            if not docs:
-                                raise Exception("No content extracted")
+                            docs = load_website_content(generic_url)
                         except Exception:
                             st.error("❌ Could not extract content from website")
                             st.info("💡 Make sure the website is accessible and allows content extraction")
@@ -674,15 +507,29 @@ if generate_summary or should_generate:
                     
                     else:  # PDF Document
                         try:
-                            docs = load_pdf_content(uploaded_file)
+                            docs = load_pdf_content(uploaded_file, pdf_hash)
                         except Exception as e:
                             st.error(f"❌ Could not process PDF: {str(e)}")
                             st.info("💡 Make sure the PDF is not password protected and contains readable text")
                             st.stop()
                     
                     # Generate summary
-                    chain = load_summarize_chain(llm, chain_type="stuff", prompt=prompt)
-                    summary = chain.run(docs)
+                    summary_key = content_hash(docs)
+                    summary_cache = st.session_state.setdefault('summary_cache', OrderedDict())
+                    if summary_key in summary_cache:
+                        summary_cache.move_to_end(summary_key)
+                        summary = summary_cache[summary_key]
+                    else:
+                        chain_type, chain_docs = select_chain(docs)
+                        chain = get_chain(groq_api_key, chain_type)
+                        stream_placeholder = st.empty()
+                        try:
+                            summary = chain.run(chain_docs, callbacks=[StreamHandler(stream_placeholder)])
+                        finally:
+                            stream_placeholder.empty()
+                        summary_cache[summary_key] = summary
+                        if len(summary_cache) > SUMMARY_CACHE_SIZE:
+                            summary_cache.popitem(last=False)
                 
                 # Display results
                 if summary and summary.strip():
@@ -701,14 +548,14 @@ if generate_summary or should_generate:
                     # Stats - Centered and Enhanced
                     st.markdown('<div style="display: flex; justify-content: center; margin: 2rem 0;">', unsafe_allow_html=True)
                     col1, col2, col3 = st.columns([1, 1, 1], gap="medium")
-                    total_content = " ".join([doc.page_content for doc in docs])
+                    source_words = sum(len(doc.page_content.split()) for doc in docs)
                     
                     with col1:
                         st.markdown(f"""
                         <div class="metric-container">
                             <div data-testid="metric-container">
-                                <div data-testid="metric-container-label">📄 {"Pages" if content_type=="📄 PDF Document" else "Documents"}</div>
-                                <div data-testid="metric-container-value">{len(docs)}</div>
+                                <div data-testid="metric-container-label">📄 {"Pages" if content_type is CType.PDF else "Documents"}</div>
+                                <div data-testid="metric-container-value">{docs[0].metadata["pages"] if content_type is CType.PDF else len(docs)}</div>
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
@@ -728,7 +575,7 @@ if generate_summary or should_generate:
                         <div class="metric-container">
                             <div data-testid="metric-container">
                                 <div data-testid="metric-container-label">📝 Source Words</div>
-                                <div data-testid="metric-container-value">{len(total_content.split())}</div>
+                                <div data-testid="metric-container-value">{source_words}</div>
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
@@ -739,11 +586,11 @@ if generate_summary or should_generate:
                     
                     # Show content type info
                     content_icons = {
-                        "🎥 YouTube Video": "🎬",
-                        "🌐 Website/Article": "🌐", 
-                        "📄 PDF Document": "📄"
+                        CType.YT: "🎬",
+                        CType.WEB: "🌐",
+                        CType.PDF: "📄"
                     }
-                    st.info(f"{content_icons[content_type]} Successfully summarized {content_type.lower()}")
+                    st.info(f"{content_icons[content_type]} Successfully summarized {CONTENT_LABELS[content_type].lower()}")
                     
                     st.success("✅ Summary completed!")
                 else: